@@ -145,6 +145,38 @@ def get_plan_info(tool_context: ToolContext) -> dict:
     else:
         return {"status": "success", "plan_info": res.json()}
 
+def compare_plans(plan_ids: list[str], tool_context: ToolContext) -> dict:
+    """Retrieves a side-by-side comparison of the user's course plans.
+
+    Args:
+        plan_ids (list[str]): The ids of the plans to compare, as returned in the 'planId' field of a previous comparison.
+                              Pass an empty list to compare all of the user's plans.
+        tool_context (ToolContext): The tool context object.
+
+    Returns:
+        dict: A dictionary containing the comparison.
+              Includes a 'status' key ('success' or 'error').
+              If 'success', includes a 'comparison' key with the units, conflicts, days, times and instructors of each plan,
+              as well as the courses and sections shared between plans.
+              The comparison's 'missingPlanIds' key lists any requested plan ids that do not exist.
+              If 'error', includes an 'error_message' key.
+    """
+
+    user_id = tool_context._invocation_context.session.user_id
+    print(f"--- Tool: compare_plans called for user {user_id} with plans {plan_ids}")
+
+    res = requests.get(
+        f"{BACKEND_URL}/plan/compare",
+        params={
+            "user_id": user_id,
+            "plan_ids": plan_ids or None
+        })
+
+    if res.status_code >= 400:
+        return {"status": "error", "error_message": "Failed to compare course plans"}
+    else:
+        return {"status": "success", "comparison": res.json()}
+
 def add_section(course_code: str, section_id: str, term: str, tool_context: ToolContext) -> dict:
     """Retrieves the information for a specified course from the USC Classes API.
 
@@ -288,12 +320,16 @@ root_agent = Agent(
                    After presenting the results of a course lookup, ask the user if they would like to add a section.
                    3. If the user asks for course recommendations on their plan or major, use the get_plan_info and/or get_major_info tools
                    respectively to retrieve the relevant information.
-                   4. Ask the user to clarify anything you may need to make the best recommendation possible.
-                   5. If any of the tools fail, simply ask the user to provide any missing information and/or corrections.
-                   6. If the user needs to modify their schedule, delegate tasks to the Scheduling Agent.
-                   7. If the user asks about what a professor is like, use the Professor Agent tool.
+                   4. If the user asks to compare their course plans (e.g. which plan has fewer units, conflicts or early classes),
+                   use the compare_plans tool with an empty plan_ids list to compare all of their plans at once. When talking to the user, refer to plans by their titles.
+                   Never guess plan ids; to compare only specific plans, use the 'planId' values returned by a previous comparison.
+                   If the comparison reports any missingPlanIds, tell the user those plans could not be found.
+                   5. Ask the user to clarify anything you may need to make the best recommendation possible.
+                   6. If any of the tools fail, simply ask the user to provide any missing information and/or corrections.
+                   7. If the user needs to modify their schedule, delegate tasks to the Scheduling Agent.
+                   8. If the user asks about what a professor is like, use the Professor Agent tool.
                 """,
-    tools=[get_course_info, course_search, get_plan_info, get_major_info, agent_tool.AgentTool(professor_agent)],
+    tools=[get_course_info, course_search, get_plan_info, get_major_info, compare_plans, agent_tool.AgentTool(professor_agent)],
     sub_agents=[scheduling_agent]
 )
 
@@ -1,10 +1,11 @@
-from fastapi import FastAPI, HTTPException, status
+from fastapi import FastAPI, HTTPException, Query, status
 from fastapi.middleware.cors import CORSMiddleware
 import vertexai
 import firebase_admin
 from firebase_admin import firestore, credentials
 from dotenv import load_dotenv
 import os
+import re
 import requests
 
 
@@ -43,6 +44,59 @@ client = vertexai.Client(
 
 adk_app = client.agent_engines.get(name=AGENT_ENGINE_RESOURCE_NAME)
 
+def to_minutes(time:str):
+    hour, minute = time.split(":")
+    return int(hour) * 60 + int(minute)
+
+def find_conflicts(courses:list):
+    conflicts = []
+    for i in range(len(courses)):
+        for j in range(i + 1, len(courses)):
+            a = courses[i]
+            b = courses[j]
+            shared_days = set(a.get("days") or []) & set(b.get("days") or [])
+            if not shared_days:
+                continue
+            if not (a.get("startTime") and a.get("endTime") and b.get("startTime") and b.get("endTime")):
+                continue
+            if to_minutes(a["startTime"]) < to_minutes(b["endTime"]) and to_minutes(b["startTime"]) < to_minutes(a["endTime"]):
+                conflicts.append({
+                    "sectionIds": [a["sectionId"], b["sectionId"]],
+                    "courseCodes": [a["courseCode"], b["courseCode"]],
+                    "days": sorted(shared_days)
+                })
+    return conflicts
+
+def summarize_plan(plan_id:str, plan:dict):
+    courses = plan.get("courses", [])
+
+    days = {}
+    instructors = set()
+    start_times = []
+    end_times = []
+    for course in courses:
+        for day in course.get("days") or []:
+            days[day] = days.get(day, 0) + 1
+        for instructor in course.get("instructors") or []:
+            instructors.add(f"{instructor.get('firstName', '')} {instructor.get('lastName', '')}".strip())
+        if course.get("startTime") and course.get("endTime"):
+            start_times.append(course["startTime"])
+            end_times.append(course["endTime"])
+
+    return {
+        "planId": plan_id,
+        "title": plan.get("title"),
+        "courseCount": len(courses),
+        "units": sum(float(course.get("units") or 0) for course in courses),
+        "courseCodes": sorted({course["courseCode"] for course in courses}),
+        "sectionIds": sorted({course["sectionId"] for course in courses}),
+        "days": days,
+        "earliestStart": min(start_times, key=to_minutes) if start_times else None,
+        "latestEnd": max(end_times, key=to_minutes) if end_times else None,
+        "instructors": sorted(name for name in instructors if name),
+        "conflicts": find_conflicts(courses)
+    }
+
 @app.post("/session/create")
 async def create_session(user_id:str, plan_id:str, major:str):
     res = await adk_app.async_create_session(user_id=user_id, state={'plan_id': plan_id, 'major': major})
@@ -75,6 +129,59 @@ def get_plan(user_id:str, plan_id:str):
             detail="User or plan does not exist!"
         )
 
+@app.get("/plan/compare")
+def compare_plans(user_id:str, plan_ids:list[str] = Query(default=[])):
+    plans_ref = db.collection("users").document(user_id).collection("coursePlans")
+
+    plan_ids = list(dict.fromkeys(plan_ids))
+    for plan_id in plan_ids:
+        # Firestore rejects these ids outright, so catch them before querying.
+        if not plan_id or "/" in plan_id or plan_id in (".", "..") or re.fullmatch(r"__.*__", plan_id) or len(plan_id.encode()) > 1500:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid plan id!"
+            )
+
+    # Load every requested plan in one batched read instead of a get per plan,
+    # skipping fields like chat history that the comparison doesn't need.
+    fields = ["title", "courses"]
+    if plan_ids:
+        docs = db.get_all([plans_ref.document(plan_id) for plan_id in plan_ids], field_paths=fields)
+    else:
+        docs = plans_ref.select(fields).stream()
+
+    summaries = []
+    missing_plan_ids = []
+    for doc in docs:
+        if doc.exists:
+            summaries.append(summarize_plan(doc.id, doc.to_dict()))
+        else:
+            missing_plan_ids.append(doc.id)
+
+    if len(summaries) == 0:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Plans do not exist: {', '.join(missing_plan_ids)}" if missing_plan_ids else "User or plans do not exist!"
+        )
+
+    overlap = []
+    for i in range(len(summaries)):
+        for j in range(i + 1, len(summaries)):
+            a = summaries[i]
+            b = summaries[j]
+            overlap.append({
+                "planIds": [a["planId"], b["planId"]],
+                "sharedCourseCodes": sorted(set(a["courseCodes"]) & set(b["courseCodes"])),
+                "sharedSectionIds": sorted(set(a["sectionIds"]) & set(b["sectionIds"]))
+            })
+
+    return {
+        "plans": summaries,
+        "overlap": overlap,
+        "missingPlanIds": missing_plan_ids,
+        "commonCourseCodes": sorted(set.intersection(*(set(summary["courseCodes"]) for summary in summaries)))
+    }
+
 @app.post("/plan/add")
 def add_to_schedule(user_id:str, term_code:str, course_code:str, section_id:str, plan_id:str):
 